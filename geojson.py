@@ -1,10 +1,21 @@
 import uuid, json
+from array import array
+from collections import Counter
+from itertools import chain
 from abc import abstractmethod, ABC
 from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Iterator, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Jsonable(ABC):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def to_json(cls) -> dict[str, Any]:
@@ -15,9 +26,99 @@ class Jsonable(ABC):
             object: The object as a JSON object
         """
 
+    def _to_json_shallow(self) -> dict[str, Any]:
+        """
+        Converts the object to a JSON object, leaving nested Jsonable objects for _GeoEncoder to convert
+
+        Returns:
+            object: The object as a JSON object that may contain Jsonable objects
+        """
+        return self.to_json()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "to_json" not in cls.__dict__ and any("_json_options" in c.__dict__ for c in cls.__mro__):
+            cls.to_json = _compile_to_json(cls)
+
     def __str__(self) -> str:
         return str(self.to_json())
 
+class _GeoEncoder(json.JSONEncoder):
+    """
+    Serializes Jsonable objects as json.dumps reaches them, instead of building the whole JSON object up front
+    """
+    def default(self, o):
+        if isinstance(o, Jsonable):
+            return o._to_json_shallow()
+        return super().default(o)
+
+def _dumps(obj) -> str:
+    """
+    Serializes an object to a compact JSON string, using orjson when it is installed
+
+    Both backends write the same compact separators, and both write NaN and Infinity as null, as orjson does.
+    orjson raises for values it cannot encode, such as integers wider than 64 bits, instead of falling back to json.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        str: The object as a JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_GeoEncoder().default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    text = json.dumps(obj, cls=_GeoEncoder, separators=(",", ":"))
+    if "NaN" in text or "Infinity" in text:
+        text = json.dumps(json.loads(text, parse_constant=lambda _: None), separators=(",", ":"))
+    return text
+
+def _compile_to_json(cls):
+    """
+    Generates an unrolled to_json for a class from the _json_keys and _json_options declared along its MRO
+
+    Options are emitted base class first, so a non-None value on a subclass overrides the same option on a base class.
+    The "offset" option is expanded from an (x, y) tuple to an { "x", "y" } object.
+
+    Args:
+        cls: The class to generate to_json for
+
+    Returns:
+        function: The generated to_json function
+    """
+    keys = []
+    options = []
+    for c in reversed(cls.__mro__):
+        for key in c.__dict__.get("_json_keys", ()):
+            if key not in keys:
+                keys.append(key)
+        for option in c.__dict__.get("_json_options", {}).items():
+            if option not in options:
+                options.append(option)
+
+    lines = [
+        "def to_json(self):",
+        "    obj = {%s}" % ", ".join("%r: self.%s" % (key, key) for key in keys),
+        "    options = {}",
+    ]
+    for key, attr in options:
+        if key == "offset":
+            lines.append("    if self.%s: options[%r] = { 'x': self.%s[0], 'y': self.%s[1] }" % (attr, key, attr, attr))
+        else:
+            lines.append("    if self.%s is not None: options[%r] = self.%s" % (attr, key, attr))
+    lines.append("    if options: obj['options'] = options")
+    lines.append("    return obj")
+
+    namespace = {}
+    exec("\n".join(lines), {}, namespace)
+    to_json = namespace["to_json"]
+    to_json.__qualname__ = "%s.to_json" % cls.__qualname__
+    return to_json
+
 class GeoJSONException(Exception):
     """
     Represents a GeoJSON exception
@@ -34,7 +135,7 @@ class FeatureException(GeoJSONException):
         self.message = message
         super(Exception, self).__init__(message)
 
-class FeatureType:
+class FeatureType(StrEnum):
     """
     Represents all feature types supported by GeoJSON
     """
@@ -46,7 +147,7 @@ class FeatureType:
     MULTI_POLYGON = "MultiPolygon"
     GEOMETRY_COLLECTION = "GeometryCollection"
 
-@dataclass
+@dataclass(slots=True)
 class Layer(Jsonable):
     """
     A set of methods from the Layer base class that all Leaflet layers use.
@@ -54,17 +155,12 @@ class Layer(Jsonable):
     pane: str = None
     attribution: str = None
 
-    def to_json(self) -> dict[str, Any]:
-        return add_not_empty(
-            {},
-            "options",
-            compact_options(
-                pane=self.pane,
-                attribution=self.attribution
-            )
-        )
-
-@dataclass
+    _json_options = {
+        "pane": "pane",
+        "attribution": "attribution",
+    }
+
+@dataclass(slots=True)
 class InteractiveLayer(Layer):
     """
     Some Layers can be made interactive - when the user interacts with such a layer,
@@ -73,20 +169,12 @@ class InteractiveLayer(Layer):
     interactive: bool = None
     bubbling_mouse_events: bool = None
 
-    def to_json(self):
-        return soft_update(
-            super().to_json(),
-            add_not_empty(
-                {},
-                "options",
-                compact_options(
-                    interactive=self.interactive,
-                    bubbling_mouse_events=self.bubbling_mouse_events
-                )
-            )
-        )
-
-@dataclass
+    _json_options = {
+        "interactive": "interactive",
+        "bubbling_mouse_events": "bubbling_mouse_events",
+    }
+
+@dataclass(slots=True)
 class DivOverlay(InteractiveLayer):
     """
     Base model for Popup and Tooltip.
@@ -97,22 +185,15 @@ class DivOverlay(InteractiveLayer):
     pane: str = None
     content: str|object = None
 
-    def to_json(self):
-        return soft_update(
-            super().to_json(),
-            add_not_empty(
-                { "content": self.content },
-                "options",
-                compact_options(
-                    interactive=self.interactive,
-                    offset={ "x": self.offset[0], "y": self.offset[1] } if self.offset else None,
-                    className=self.class_name,
-                    pane=self.pane,
-                )
-            )
-        )
-
-@dataclass
+    _json_keys = ("content",)
+    _json_options = {
+        "interactive": "interactive",
+        "offset": "offset",
+        "className": "class_name",
+        "pane": "pane",
+    }
+
+@dataclass(slots=True)
 class Icon(Jsonable):
     path: str = ""
     size: list = field(default_factory=lambda: [100, 100])
@@ -128,7 +209,7 @@ class Icon(Jsonable):
             "color": self.color
         }
 
-@dataclass
+@dataclass(slots=True)
 class Tooltip(DivOverlay):
     text: str = ""
     offset: tuple = None
@@ -137,28 +218,20 @@ class Tooltip(DivOverlay):
     sticky: bool = None
     opacity: float = None
 
+    _json_options = {
+        "offset": "offset",
+        "direction": "direction",
+        "permanent": "permanent",
+        "sticky": "sticky",
+        "opacity": "opacity",
+    }
+
     def __post_init__(self):
         self.content = {
             "text": self.text
         }
 
-    def to_json(self):
-        return soft_update(
-            super().to_json(),
-            add_not_empty(
-                {},
-                "options",
-                compact_options(
-                    offset={ "x": self.offset[0], "y": self.offset[1] } if self.offset else None,
-                    direction=self.direction,
-                    permanent=self.permanent,
-                    sticky=self.sticky,
-                    opacity=self.opacity,
-                )
-            )
-        )
-
-@dataclass
+@dataclass(slots=True)
 class Popup(DivOverlay):
     text: str = ""
     pane: str = None
@@ -177,38 +250,30 @@ class Popup(DivOverlay):
     closeOnClick: bool = None
     className: bool = None
 
+    _json_options = {
+        "pane": "pane",
+        "offset": "offset",
+        "maxWidth": "maxWidth",
+        "minWidth": "minWidth",
+        "maxHeight": "maxHeight",
+        "autoPan": "autoPan",
+        "autoPanPaddingTopLeft": "autoPanPaddingTopLeft",
+        "autoPanPaddingBottomRight": "autoPanPaddingBottomRight",
+        "autoPanPadding": "autoPanPadding",
+        "keepInView": "keepInView",
+        "closeButton": "closeButton",
+        "autoClose": "autoClose",
+        "closeOnEscapeKey": "closeOnEscapeKey",
+        "closeOnClick": "closeOnClick",
+        "className": "className",
+    }
+
     def __post_init__(self):
         self.content = {
             "text": self.text
         }
 
-    def to_json(self):
-        return soft_update(
-            super().to_json(),
-            add_not_empty(
-                {},
-                "options",
-                compact_options(
-                    pane=self.pane,
-                    offset={ "x": self.offset[0], "y": self.offset[1] } if self.offset else None,
-                    maxWidth=self.maxWidth,
-                    minWidth=self.minWidth,
-                    maxHeight=self.maxHeight,
-                    autoPan=self.autoPan,
-                    autoPanPaddingTopLeft=self.autoPanPaddingTopLeft,
-                    autoPanPaddingBottomRight=self.autoPanPaddingBottomRight,
-                    autoPanPadding=self.autoPanPadding,
-                    keepInView=self.keepInView,
-                    closeButton=self.closeButton,
-                    autoClose=self.autoClose,
-                    closeOnEscapeKey=self.closeOnEscapeKey,
-                    closeOnClick=self.closeOnClick,
-                    className=self.className
-                )
-            )
-        )
-
-@dataclass
+@dataclass(slots=True)
 class Marker(Jsonable):
     """
     Used to display clickable/draggable icons on the map.
@@ -218,21 +283,35 @@ class Marker(Jsonable):
     popup: Popup = None
 
     def to_json(self):
-        return soft_updates(
-            add_not_empty({}, "icon", self.icon.to_json()) if self.icon else {},
-            add_not_empty({}, "tooltip", self.tooltip.to_json()) if self.tooltip else {},
-            add_not_empty({}, "popup", self.popup.to_json()) if self.popup else {}
-        )
+        obj = {}
+        if self.icon:
+            add_not_empty(obj, "icon", self.icon.to_json())
+        if self.tooltip:
+            add_not_empty(obj, "tooltip", self.tooltip.to_json())
+        if self.popup:
+            add_not_empty(obj, "popup", self.popup.to_json())
+        return obj
+
+    def _to_json_shallow(self):
+        obj = {}
+        if self.icon:
+            obj["icon"] = self.icon
+        if self.tooltip:
+            obj["tooltip"] = self.tooltip
+        if self.popup:
+            obj["popup"] = self.popup
+        return obj
 
 class Feature(Jsonable):
+    __slots__ = ("feature_type", "_id", "properties", "marker", "_geometry", "_coords")
+
+    required_keys = ("type", "properties", "geometry")
 
     def __init__(self, obj=None, f_type=""):
         self.feature_type = f_type
-        self.required_keys = ["type", "properties", "geometry"]
-        self.id = uuid.uuid4().hex
+        self._id = None
         self.properties = {}
         self.marker = None
-        self.marker = None
         self.geometry = {
             "type": f_type,
             "coordinates": []
@@ -241,6 +320,93 @@ class Feature(Jsonable):
         if obj is not None:
             self.load_json_object(obj)
 
+    @property
+    def id(self):
+        if self._id is None:
+            self._id = uuid.uuid4().hex
+        return self._id
+
+    @id.setter
+    def id(self, _id):
+        self._id = _id
+
+    @property
+    def geometry(self):
+        if self._coords is not None:
+            self._geometry["coordinates"] = self._unpack_coordinates()
+            self._coords = None
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        self._geometry = geometry
+        self._coords = None
+
+    def _set_positions(self, positions):
+        """
+        Stores the feature's positions, packed into a flat array of x, y values when every position is 2D
+
+        Args:
+            positions: The feature's [x, y] positions
+
+        Raises:
+            FeatureException: If a position is not a list or tuple of at least 2 numbers
+        """
+        if not isinstance(positions, (list, tuple)):
+            positions = list(positions)
+
+        lengths = _position_lengths(positions)
+        if lengths - {2}:
+            self._geometry["coordinates"] = self._nest_positions(_float_positions(positions, lengths))
+            return
+
+        try:
+            self._coords = array("d", chain.from_iterable(positions))
+        except TypeError:
+            raise FeatureException(_INVALID_POSITION) from None
+
+    @classmethod
+    def _from_positions(cls, positions):
+        """
+        Creates a feature directly from raw [x, y] positions, without intermediate Point objects
+
+        Args:
+            positions: The feature's [x, y] positions
+
+        Returns:
+            Feature: The feature object
+        """
+        obj = cls()
+        obj._set_positions(positions)
+        return obj
+
+    def _unpack_coordinates(self):
+        """
+        Expands the packed positions back into GeoJSON coordinates
+
+        Returns:
+            list: The feature's GeoJSON coordinates
+        """
+        it = iter(self._coords)
+        return self._nest_positions([[x, y] for x, y in zip(it, it)])
+
+    def _nest_positions(self, positions):
+        return positions
+
+    def _geometry_json(self):
+        """
+        Returns the feature's geometry as a JSON object without unpacking its stored positions
+
+        Returns:
+            object: The feature's geometry as a JSON object
+        """
+        if self._coords is None:
+            return self._geometry
+        return {
+            "type": self._geometry["type"],
+            "coordinates": self._unpack_coordinates()
+        }
+
     def load_json_object(self, obj):
         """
 
@@ -261,19 +427,25 @@ class Feature(Jsonable):
         self.geometry = obj["geometry"]
 
     def to_json(self):
+        obj = self._to_json_shallow()
+        if self.marker is not None:
+            obj["marker"] = self.marker.to_json()
+        return obj
+
+    def _to_json_shallow(self):
         obj = {
             "type": "Feature",
             "id": self.id,
             "properties": self.properties,
-            "geometry": self.geometry,
+            "geometry": self._geometry_json(),
         }
 
         if self.marker is not None:
-            obj["marker"] = self.marker.to_json()
+            obj["marker"] = self.marker
         return obj
 
     def __str__(self):
-        return json.dumps(self.to_json())
+        return _dumps(self)
 
     @classmethod
     @abstractmethod
@@ -304,6 +476,7 @@ class Feature(Jsonable):
         return [Feature(None) for _ in range(num)]
 
 class MultiFeature(Feature):
+    __slots__ = ("_type", "features")
 
     def __init__(self, _type, obj=None):
         super().__init__(obj, _type)
@@ -362,6 +535,8 @@ class MultiFeature(Feature):
         self.features.remove(obj)
 
 class Point(Feature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(obj, FeatureType.POINT)
 
@@ -383,52 +558,36 @@ class Point(Feature):
         return points
 
 class MultiPoint(MultiFeature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(FeatureType.MULTI_POINT, obj)
 
     @classmethod
     def create(cls, *points):
-        obj = cls()
-        for point in points:
-            if not isinstance(point, Point):
-                raise FeatureException("Feature must be of type Point!")
-            obj.geometry["coordinates"].append(point.geometry["coordinates"])
-        return obj
+        return cls._from_positions(_point_positions(points))
 
     @classmethod
     def many(cls, *multi_points):
-        obj = []
-        for multi_point in multi_points:
-            points = []
-            for point in multi_point:
-                points.append(Point.create(*point))
-            obj.append(MultiPoint.create(*points))
-        return obj
+        return [cls._from_positions(multi_point) for multi_point in multi_points]
 
 class LineString(Feature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(obj, FeatureType.LINE_STRING)
 
     @classmethod
     def create(cls, *points):
-        obj = cls()
-        for point in points:
-            if not isinstance(point, Point):
-                raise FeatureException("Feature must be of type LineString!")
-            obj.geometry["coordinates"].append(point.geometry["coordinates"])
-        return obj
+        return cls._from_positions(_point_positions(points))
 
     @classmethod
     def many(cls, *line_strings):
-        obj = []
-        for line_string in line_strings:
-            points = []
-            for point in line_string:
-                points.append(Point.create(point[0], point[1]))
-            obj.append(LineString.create(*points))
-        return obj
+        return [cls._from_positions(line_string) for line_string in line_strings]
 
 class MultiLineString(MultiFeature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(FeatureType.MULTI_LINE_STRING, obj)
 
@@ -438,47 +597,38 @@ class MultiLineString(MultiFeature):
         for line_string in line_strings:
             if not isinstance(line_string, LineString):
                 raise FeatureException("Feature must be of type LineString!")
-            obj.geometry["coordinates"].append(line_string.geometry["coordinates"])
+            obj.geometry["coordinates"].append(line_string._geometry_json()["coordinates"])
         return obj
 
     @classmethod
     def many(cls, *multi_line_strings):
         obj = []
         for multi_line_string in multi_line_strings:
-            line_strings = []
-            for line_string in multi_line_string:
-                points = []
-                for point in line_string:
-                    points.append(Point.create(*point))
-                line_strings.append(LineString.create(*points))
-            obj.append(MultiLineString.create(*line_strings))
+            feature = cls()
+            feature.geometry["coordinates"] = [_float_positions(line_string) for line_string in multi_line_string]
+            obj.append(feature)
         return obj
 
 class Polygon(Feature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(obj, FeatureType.POLYGON)
 
+    def _nest_positions(self, positions):
+        return [positions]
+
     @classmethod
     def create(cls, *points):
-        obj = cls()
-        obj.geometry["coordinates"].append([])
-        for point in points:
-            if not isinstance(point, Point):
-                raise FeatureException("Feature must be of type Point!")
-            obj.geometry["coordinates"][0].append(point.geometry["coordinates"])
-        return obj
+        return cls._from_positions(_point_positions(points))
 
     @classmethod
     def many(cls, *polygons):
-        obj = []
-        for polygon in polygons:
-            points = []
-            for point in polygon:
-                points.append(Point.create(*point))
-            obj.append(Polygon.create(*points))
-        return obj
+        return [cls._from_positions(polygon) for polygon in polygons]
 
 class MultiPolygon(MultiFeature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
         super().__init__(FeatureType.MULTI_POLYGON, obj)
 
@@ -488,25 +638,22 @@ class MultiPolygon(MultiFeature):
         for polygon in polygons:
             if not isinstance(polygon, Polygon):
                 raise FeatureException("Feature must be of type Polygon!")
-            obj.geometry["coordinates"].append(polygon.geometry["coordinates"])
+            obj.geometry["coordinates"].append(polygon._geometry_json()["coordinates"])
         return obj
 
     @classmethod
     def many(cls, *multi_polygons):
         obj = []
         for multi_polygon in multi_polygons:
-            polygons = []
-            for polygon in multi_polygon:
-                points = []
-                for point in polygon:
-                    points.append(Point.create(*point))
-                polygons.append(Polygon.create(*points))
-            obj.append(MultiPolygon.create(*polygons))
+            feature = cls()
+            feature.geometry["coordinates"] = [[_float_positions(polygon)] for polygon in multi_polygon]
+            obj.append(feature)
         return obj
 
 class GeometryCollection(MultiFeature):
+    __slots__ = ()
+
     def __init__(self, obj=None):
-        self.geometries = []
         super().__init__(FeatureType.GEOMETRY_COLLECTION, obj)
 
     @classmethod
@@ -514,10 +661,10 @@ class GeometryCollection(MultiFeature):
         obj = cls()
         for feature in features:
             if isinstance(feature, Feature):
-                obj.geometries.append(feature)
+                obj.features.append(feature)
                 continue
 
-            obj.geometries.append(convert_feature(feature))
+            obj.features.append(convert_feature(feature))
         return obj
 
     @classmethod
@@ -539,7 +686,7 @@ class GeometryCollection(MultiFeature):
         """
         if not isinstance(obj, Feature):
             raise TypeError("Expected a Feature object!")
-        self.geometries.append(obj)
+        self.features.append(obj)
 
     def remove(self, obj):
         """
@@ -550,10 +697,10 @@ class GeometryCollection(MultiFeature):
         """
         if not isinstance(obj, Feature):
             raise TypeError("Expected a Feature object!")
-        self.geometries.remove(obj)
+        self.features.remove(obj)
 
-    def __str__(self):
-        return json.dumps(self.to_json())
+    def _to_json_shallow(self):
+        return self.to_json()
 
     def to_json(self):
         return {
@@ -562,7 +709,7 @@ class GeometryCollection(MultiFeature):
             "properties": self.properties,
             "geometry": {
                 "type": "GeometryCollection",
-                "geometries": [{ "type": feature.feature_type, "coordinates": feature.geometry["coordinates"] } for feature in self.geometries]
+                "geometries": [{ "type": feature.feature_type, "coordinates": feature._geometry_json()["coordinates"] } for feature in self.features]
             }
         }
 
@@ -580,6 +727,9 @@ class GeoJSON(Jsonable):
         self.type = "FeatureCollection"
         self.features = []
         self.aliases = {}
+        self._alias_by_id = {}
+        self._by_id = {}
+        self._type_counts = Counter()
 
         if obj is not None:
             self.load_json_object(obj)
@@ -591,7 +741,7 @@ class GeoJSON(Jsonable):
         Returns:
             str: A string representation of the object's GeoJSON.
         """
-        return json.dumps(self.to_json())
+        return _dumps(self)
 
     def __getitem__(self, key) -> Feature | None:
         """
@@ -636,14 +786,31 @@ class GeoJSON(Jsonable):
         Returns:
             bool: Whether the GeoJSON object contains the given feature
         """
-        if not isinstance(item, FeatureType):
+        if not isinstance(item, Feature):
             raise TypeError("Expected a Feature object!")
-        return item in self.features
+        return self._by_id.get(item.id) is item
 
     def add_feature(self, feature: Feature, alias: str = None) -> None:
+        """
+        Adds a feature to the GeoJSON object
+
+        Features are indexed by id when added, so a feature's id must not be reassigned while it is in the GeoJSON object
+
+        Args:
+            feature: The feature to add to the GeoJSON object
+            alias: An optional alias to retrieve the feature by
+
+        Raises:
+            GeoJSONException: If a feature with the same id is already in the GeoJSON object
+        """
+        if feature.id in self._by_id:
+            raise GeoJSONException("A feature with id '%s' already exists!" % feature.id)
         self.features.append(feature)
+        self._by_id[feature.id] = feature
+        self._type_counts[feature.feature_type] += 1
         if alias is not None:
             self.aliases[alias] = feature.id
+            self._alias_by_id.setdefault(feature.id, []).append(alias)
 
     def remove_feature(self, feature: Feature) -> None:
         """
@@ -655,10 +822,12 @@ class GeoJSON(Jsonable):
         if not isinstance(feature, Feature):
             raise TypeError("Expected a Feature object!")
         self.features.remove(feature)
-        for alias, id in self.aliases.items():
-            if id == feature.id:
+        self._by_id.pop(feature.id, None)
+        self._type_counts[feature.feature_type] -= 1
+
+        for alias in self._alias_by_id.pop(feature.id, ()):
+            if self.aliases.get(alias) == feature.id:
                 del self.aliases[alias]
-                break
 
     def count(self, _type: FeatureType) -> int:
         """
@@ -670,10 +839,12 @@ class GeoJSON(Jsonable):
         Returns:
             int: The number of features in the GeoJSON object of type _type
         """
-        if not isinstance(_type, FeatureType):
-            raise TypeError("Type must be of type FeatureType!")
+        try:
+            _type = FeatureType(_type)
+        except ValueError:
+            raise TypeError("Type must be of type FeatureType!") from None
 
-        return len([f for f in self.features if f.feature_type == _type])
+        return self._type_counts[_type]
 
     def at_id(self, _id: str) -> Feature | None:
         """
@@ -685,8 +856,7 @@ class GeoJSON(Jsonable):
         Returns:
             Feature | None: The feature with the specified id, None if the id does not exist
         """
-        res = [f for f in self.features if f.id == id][0]
-        return res if res else None
+        return self._by_id.get(_id)
 
     def at_alias(self, alias: str) -> Feature | None:
         """
@@ -698,11 +868,7 @@ class GeoJSON(Jsonable):
         Returns:
             Feature | None: The feature with the specified alias, None if the alias does not exist
         """
-        _id = self.aliases.get(alias, None)
-        if _id is None:
-            raise GeoJSONException("No such alias '%s'" % alias)
-        res = [f for f in self.features if f.id == _id][0]
-        return res if res else None
+        return self._by_id.get(self.aliases.get(alias))
 
     def first(self) -> Feature | None:
         """
@@ -732,8 +898,10 @@ class GeoJSON(Jsonable):
         if "type" not in obj or obj["type"] != "FeatureCollection":
             raise GeoJSONException("Missing or invalid required key \"type\"!")
 
-        for feature in obj["features"]:
-            self.features.append(convert_feature(feature))
+        features = [convert_feature(feature) for feature in obj["features"]]
+        self.features.extend(features)
+        self._by_id.update((f.id, f) for f in features)
+        self._type_counts.update(f.feature_type for f in features)
 
     def to_json(self) -> dict[str, Any]:
         """
@@ -747,6 +915,26 @@ class GeoJSON(Jsonable):
             "features": [f.to_json() for f in self.features]
         }
 
+    def _to_json_shallow(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "features": self.features
+        }
+
+_INVALID_POSITION = "Feature must be of type Point or a position of at least 2 numbers!"
+
+# Keyed by the interned str values rather than the FeatureType members, so lookups with
+# type strings from json.loads stay on the exact-str dict fast path
+_FEATURE_TYPES = {
+    FeatureType.POINT.value: Point,
+    FeatureType.MULTI_POINT.value: MultiPoint,
+    FeatureType.LINE_STRING.value: LineString,
+    FeatureType.MULTI_LINE_STRING.value: MultiLineString,
+    FeatureType.POLYGON.value: Polygon,
+    FeatureType.MULTI_POLYGON.value: MultiPolygon,
+    FeatureType.GEOMETRY_COLLECTION.value: GeometryCollection,
+}
+
 def convert_feature(feature):
     """
     Instantiates a feature from a JSON object
@@ -760,62 +948,116 @@ def convert_feature(feature):
     if feature is None:
         return Feature(None)
 
-    f_type = feature["geometry"]["type"]
-    if f_type == FeatureType.POINT:
-        return Point(feature)
-    elif f_type == FeatureType.MULTI_POINT:
-        return MultiPoint(feature)
-    elif f_type == FeatureType.LINE_STRING:
-        return LineString(feature)
-    elif f_type == FeatureType.MULTI_LINE_STRING:
-        return MultiLineString(feature)
-    elif f_type == FeatureType.POLYGON:
-        return Polygon(feature)
-    elif f_type == FeatureType.MULTI_POLYGON:
-        return Polygon(feature)
-    elif f_type == FeatureType.GEOMETRY_COLLECTION:
-        return GeometryCollection(feature)
-    return Feature(None)
+    f_class = _FEATURE_TYPES.get(feature["geometry"]["type"])
+    if f_class is None:
+        return Feature(None)
+    return f_class(feature)
 
-def soft_update(obj_a: dict[str, Any], obj_b: dict[str, Any]):
+def _point_positions(points):
     """
-    Combines all objects shared between two objects, keeping any conflicting non-object values from obj_b
+    Collects the positions of Point objects and/or raw [x, y] positions
 
     Args:
-        obj_a: An object to merge
-        obj_b: An object to merge
+        points: The Point objects and/or [x, y] positions
 
     Returns:
-        object: The merged object
+        list: The [x, y] positions
+
+    Raises:
+        FeatureException: If an item is a Feature other than a Point
     """
-    obj = {}
+    positions = []
+    for point in points:
+        if isinstance(point, Point):
+            positions.append(point._geometry["coordinates"])
+        elif isinstance(point, Feature):
+            raise FeatureException(_INVALID_POSITION)
+        else:
+            positions.append(point)
+    return positions
 
-    for key in obj_a.keys() | obj_b.keys():
-        val_a = obj_a.get(key)
-        val_b = obj_b.get(key)
+def _position_lengths(positions):
+    """
+    Checks that every position is a list or tuple of at least 2 values
 
-        if isinstance(val_a, dict) and isinstance(val_b, dict):
-            obj[key] = soft_update(val_a, val_b)
-        elif key in obj_b:
-            obj[key] = val_b
-        else:
-            obj[key] = val_a
+    Args:
+        positions: A list or tuple of positions
 
-    return obj
+    Returns:
+        set: The distinct position lengths
+
+    Raises:
+        FeatureException: If a position is not a list or tuple of at least 2 values
+    """
+    if set(map(type, positions)) - {list, tuple}:
+        raise FeatureException(_INVALID_POSITION)
+
+    lengths = set(map(len, positions))
+    if lengths and min(lengths) < 2:
+        raise FeatureException(_INVALID_POSITION)
+    return lengths
+
+def _float_positions(positions, lengths=None):
+    """
+    Copies positions into new lists of floats
+
+    Args:
+        positions: The positions to copy
+        lengths: The distinct position lengths, if already checked
+
+    Returns:
+        list: The positions as lists of floats
+
+    Raises:
+        FeatureException: If a position is not a list or tuple of at least 2 numbers
+    """
+    if lengths is None:
+        if not isinstance(positions, (list, tuple)):
+            positions = list(positions)
+        lengths = _position_lengths(positions)
+
+    try:
+        if lengths - {2}:
+            return [[c + 0.0 for c in p] for p in positions]
+        return [[x + 0.0, y + 0.0] for x, y in positions]
+    except TypeError:
+        raise FeatureException(_INVALID_POSITION) from None
+
+def soft_update(obj_a: dict[str, Any], obj_b: dict[str, Any]):
+    """
+    Merges obj_b into obj_a in place, combining nested objects and keeping any conflicting non-object values from obj_b
+
+    Nested objects from obj_b are copied into obj_a, so obj_b is never referenced or modified by later merges.
+
+    Args:
+        obj_a: The object to merge into, updated in place
+        obj_b: The object to merge from
+
+    Returns:
+        object: obj_a, with obj_b merged into it
+    """
+    stack = [(obj_a, obj_b)]
+    while stack:
+        dst, src = stack.pop()
+        for key, val_b in src.items():
+            if isinstance(val_b, dict):
+                val_a = dst.get(key)
+                if not isinstance(val_a, dict):
+                    val_a = dst[key] = {}
+                stack.append((val_a, val_b))
+                continue
+            dst[key] = val_b
+
+    return obj_a
 
 def soft_updates(*args: *tuple[dict[str, Any]]):
     obj = {}
     for curr in args:
-        obj = soft_update(obj, curr)
+        soft_update(obj, curr)
     return obj
 
 def compact_options(**kwargs: dict[str, Any]):
-    return { key: _clean(value) for key, value in kwargs.items() if value is not None }
-
-def _clean(value: str | int | float | bool | None | list | dict):
-    if isinstance(value, dict):
-        return { k: _clean(v) for k, v in value.items() if v is not None }
-    return value
+    return { key: value for key, value in kwargs.items() if value is not None }
 
 def add_not_empty(base: dict, key: str, value: str | int | float | bool | None | list | dict):
     """
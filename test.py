@@ -1,4 +1,5 @@
 import json, os
+from dataclasses import dataclass
 import geojson as geo
 
 if __name__ == "__main__":
@@ -108,3 +109,128 @@ if __name__ == "__main__":
     print("Built GeoJSON object -> generated.geo.json")
     with open("generated.geo.json", "w") as f:
         f.write(str(build_geojson))
+
+    # soft_updates merges into a new object without modifying its arguments
+    first = {"options": {"x": 1}}
+    second = {"options": {"y": 2, "offset": {"x": 1, "y": 2}}}
+    merged = geo.soft_updates(first, second, {"options": {"z": 3}})
+    assert merged == {"options": {"x": 1, "y": 2, "z": 3, "offset": {"x": 1, "y": 2}}}
+    assert first == {"options": {"x": 1}}
+    merged["options"]["offset"]["x"] = 5
+    assert second == {"options": {"y": 2, "offset": {"x": 1, "y": 2}}}
+
+    # Features are indexed by id, and the same feature cannot be added twice
+    duplicate = geo.Point.create(1, 2)
+    index_geojson = geo.GeoJSON()
+    index_geojson.add_feature(duplicate)
+    try:
+        index_geojson.add_feature(duplicate)
+        raise AssertionError("Expected adding a duplicate feature to fail")
+    except geo.GeoJSONException:
+        pass
+    index_geojson.remove_feature(duplicate)
+    assert duplicate not in index_geojson.features
+    assert len(index_geojson) == 0 and index_geojson.at_id(duplicate.id) is None
+
+    # Every many() path stores positions the same way
+    assert geo.LineString.many([[1, 2], [3, 4]])[0].to_json()["geometry"]["coordinates"] == [[1.0, 2.0], [3.0, 4.0]]
+    assert geo.MultiLineString.many([[[1, 2], [3, 4]]])[0].to_json()["geometry"]["coordinates"] == [[[1.0, 2.0], [3.0, 4.0]]]
+    assert geo.MultiPolygon.many([[[0, 0], [1, 1], [0, 0]]])[0].to_json()["geometry"]["coordinates"] == [[[[0.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]]
+    assert type(geo.MultiLineString.many([[[1, 2], [3, 4]]])[0].to_json()["geometry"]["coordinates"][0][0][0]) is float
+    for many, invalid in [
+        (geo.LineString.many, [[1, 2], [3, "4"]]),
+        (geo.MultiLineString.many, [[[1, 2], [3, "4"]]]),
+        (geo.MultiPolygon.many, [[[1, 2], [3, "4"]]]),
+    ]:
+        try:
+            many(invalid)
+            raise AssertionError("Expected %s to reject a non-numeric position" % many.__qualname__)
+        except geo.FeatureException:
+            pass
+
+    # Editing a feature's JSON output does not change later output
+    packed = geo.LineString.create([1, 2], [3, 4])
+    output = packed.to_json()
+    output["geometry"]["coordinates"].append([9, 9])
+    output["id"] = "edited"
+    assert packed.to_json()["geometry"]["coordinates"] == [[1.0, 2.0], [3.0, 4.0]]
+    assert packed.to_json()["id"] == packed.id
+    assert packed.geometry["coordinates"] == [[1.0, 2.0], [3.0, 4.0]]
+
+    # Membership, id lookup and type counts
+    loaded_feature = geojson.first()
+    assert loaded_feature in geojson
+    assert geo.Point.create(1, 2) not in geojson
+    assert geojson.at_id(loaded_feature.id) is loaded_feature
+    assert geojson.at_id("missing") is None
+    assert geojson.count(geo.FeatureType.POLYGON) == 2
+    assert geojson.count("Point") == 1
+    assert build_geojson.count(geo.FeatureType.GEOMETRY_COLLECTION) == 2
+    try:
+        geojson.count("Circle")
+        raise AssertionError("Expected counting an unknown type to fail")
+    except TypeError:
+        pass
+
+    # MultiPolygon features load as MultiPolygon
+    multi_polygon_geojson = geo.GeoJSON({
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "coordinates": [[[[0, 0], [1, 0], [1, 1], [0, 0]]], [[[5, 5], [6, 5], [6, 6], [5, 5]]]],
+                    "type": "MultiPolygon"
+                }
+            }
+        ]
+    })
+    assert isinstance(multi_polygon_geojson.first(), geo.MultiPolygon)
+    assert multi_polygon_geojson.count("MultiPolygon") == 1
+    assert multi_polygon_geojson.count("Polygon") == 0
+
+    # Anything other than a Point or a position is rejected
+    for invalid in [5, "ab", [1], [1, "2"], [1, 2, "3"], geo.LineString.create([0, 0], [1, 1])]:
+        try:
+            geo.LineString.create(invalid)
+            raise AssertionError("Expected %r to be rejected" % (invalid,))
+        except geo.FeatureException:
+            pass
+    assert geo.Polygon.create((0, 0), geo.Point.create(1, 1), [2, 2, 3]).to_json()["geometry"]["coordinates"] == [[[0.0, 0.0], [1.0, 1.0], [2.0, 2.0, 3.0]]]
+
+    # String output is compact and writes non-finite floats as null with either JSON backend
+    non_finite = geo.Point.create(1, 2)
+    non_finite.properties = {"nan": float("nan"), "inf": float("inf"), "text": "NaN"}
+    assert json.loads(str(non_finite))["properties"] == {"nan": None, "inf": None, "text": "NaN"}
+    assert ", " not in str(non_finite) and '": ' not in str(non_finite)
+
+    # Leaflet UI elements serialize their options, with subclass options taking precedence
+    assert geo.Tooltip(text="t", offset=(1, 2), direction="top", pane="p").to_json() == {
+        "content": {"text": "t"},
+        "options": {"pane": "p", "offset": {"x": 1, "y": 2}, "direction": "top"}
+    }
+    assert geo.Popup().to_json() == {"content": {"text": ""}}
+    assert geo.Popup(offset=(3, 4), maxWidth=10).to_json()["options"] == {"offset": {"x": 3, "y": 4}, "maxWidth": 10}
+    assert geo.Popup(class_name="a").to_json()["options"] == {"className": "a"}
+    assert geo.Popup(class_name="a", className="b").to_json()["options"] == {"className": "b"}
+    assert geo.Marker(icon=geo.Icon(path="p"), popup=geo.Popup(text="x", interactive=False)).to_json() == {
+        "icon": {"path": "p", "size": {"width": 100, "height": 100}, "color": "black"},
+        "popup": {"content": {"text": "x"}, "options": {"interactive": False}}
+    }
+
+    @dataclass
+    class LabelTooltip(geo.Tooltip):
+        label: str = None
+
+        _json_options = {"label": "label"}
+
+    @dataclass
+    class PlainTooltip(geo.Tooltip):
+        note: str = None
+
+    assert LabelTooltip(text="t", offset=(5, 6), sticky=True, label="l").to_json() == {
+        "content": {"text": "t"},
+        "options": {"offset": {"x": 5, "y": 6}, "sticky": True, "label": "l"}
+    }
+    assert PlainTooltip(text="t", note="n", opacity=0.5).to_json() == {"content": {"text": "t"}, "options": {"opacity": 0.5}}